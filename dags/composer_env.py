@@ -14,6 +14,7 @@
 
 """The file for helper functions and common constants."""
 
+import datetime
 import os
 
 
@@ -26,6 +27,14 @@ DEV_COMPOSER_ENV_NAME = "ml-automation-solutions-dev"
 COMPOSER_ENVIRONMENT = "COMPOSER_ENVIRONMENT"
 COMPOSER_LOCATION = "COMPOSER_LOCATION"
 
+# Retry transient TPU/GCE task failures with exponential backoff
+RETRY_DEFAULT_ARGS = {
+    "retries": 2,
+    "retry_delay": datetime.timedelta(minutes=2),
+    "retry_exponential_backoff": True,
+    "max_retry_delay": datetime.timedelta(minutes=15),
+}
+
 
 def is_prod_env() -> bool:
   """Indicate if the composer environment is Prod."""
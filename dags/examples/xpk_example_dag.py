@@ -18,10 +18,18 @@ import datetime
 from airflow import models
 from dags.vm_resource import TpuVersion, Project, Zone, ClusterName, DockerImage
 from dags.examples.configs import xpk_example_config as config
-from dags import test_owner
+from dags import composer_env, test_owner
 from xlml.utils import name_format
 from airflow.utils.task_group import TaskGroup
 
+
+TPU_ZONE = Zone.US_CENTRAL2_B.value
+DOCKER_IMAGE = DockerImage.XPK_JAX_TEST.value
+SINGLE_SLICE_PROJECT = Project.CLOUD_ML_AUTO_SOLUTIONS.value
+SINGLE_SLICE_CLUSTER = ClusterName.V4_8_CLUSTER.value
+MULTI_SLICE_PROJECT = Project.TPU_PROD_ENV_MULTIPOD.value
+MULTI_SLICE_CLUSTER = ClusterName.V4_128_MULTISLICE_CLUSTER.value
+
 # TODO(ranran): add following examples:
 # 1) jax_resnet_tpu_qr (diff dag)
 # 2) jax_vit_tpu_qr_benchmark (diff dag)
@@ -32,26 +40,27 @@ with models.DAG(
     tags=["example", "gke", "xlml", "benchmark"],
     start_date=datetime.datetime(2023, 11, 29),
     catchup=False,
+    default_args=composer_env.RETRY_DEFAULT_ARGS,
 ) as dag:
   flax_resnet_tpu_singleslice_v4_8 = config.get_flax_resnet_xpk_config(
       tpu_version=TpuVersion.V4,
       tpu_cores=8,
-      tpu_zone=Zone.US_CENTRAL2_B.value,
+      tpu_zone=TPU_ZONE,
       test_name="resnet-single-slice",
-      project_name=Project.CLOUD_ML_AUTO_SOLUTIONS.value,
-      cluster_name=ClusterName.V4_8_CLUSTER.value,
-      docker_image=DockerImage.XPK_JAX_TEST.value,
+      project_name=SINGLE_SLICE_PROJECT,
+      cluster_name=SINGLE_SLICE_CLUSTER,
+      docker_image=DOCKER_IMAGE,
       time_out_in_min=60,
   ).run()
 
   flax_resnet_tpu_multislice_v4_128 = config.get_flax_resnet_xpk_config(
       tpu_version=TpuVersion.V4,
       tpu_cores=128,
-      tpu_zone=Zone.US_CENTRAL2_B.value,
+      tpu_zone=TPU_ZONE,
       test_name="resnet-multi-slice",
-      project_name=Project.TPU_PROD_ENV_MULTIPOD.value,
-      cluster_name=ClusterName.V4_128_MULTISLICE_CLUSTER.value,
-      docker_image=DockerImage.XPK_JAX_TEST.value,
+      project_name=MULTI_SLICE_PROJECT,
+      cluster_name=MULTI_SLICE_CLUSTER,
+      docker_image=DOCKER_IMAGE,
       time_out_in_min=60,
       num_slices=2,
   ).run()
@@ -77,22 +86,22 @@ with models.DAG(
     chained_resnet_tpu_singleslice_v4_8 = config.get_flax_resnet_xpk_config(
         tpu_version=TpuVersion.V4,
         tpu_cores=8,
-        tpu_zone=Zone.US_CENTRAL2_B.value,
+        tpu_zone=TPU_ZONE,
         test_name="chained-resnet-single-slice",
-        project_name=Project.CLOUD_ML_AUTO_SOLUTIONS.value,
-        cluster_name=ClusterName.V4_8_CLUSTER.value,
-        docker_image=DockerImage.XPK_JAX_TEST.value,
+        project_name=SINGLE_SLICE_PROJECT,
+        cluster_name=SINGLE_SLICE_CLUSTER,
+        docker_image=DOCKER_IMAGE,
         time_out_in_min=60,
     ).run(gcs_location=shared_gcs_location)
 
     chained_resnet_tpu_multislice_v4_128 = config.get_flax_resnet_xpk_config(
         tpu_version=TpuVersion.V4,
         tpu_cores=128,
-        tpu_zone=Zone.US_CENTRAL2_B.value,
+        tpu_zone=TPU_ZONE,
         test_name="chained-resnet-multi-slice",
-        project_name=Project.TPU_PROD_ENV_MULTIPOD.value,
-        cluster_name=ClusterName.V4_128_MULTISLICE_CLUSTER.value,
-        docker_image=DockerImage.XPK_JAX_TEST.value,
+        project_name=MULTI_SLICE_PROJECT,
+        cluster_name=MULTI_SLICE_CLUSTER,
+        docker_image=DOCKER_IMAGE,
         time_out_in_min=60,
         num_slices=2,
     ).run(gcs_location=shared_gcs_location)
@@ -16,16 +16,92 @@
 
 import datetime
 import json
-from typing import Dict
+from typing import Dict, Tuple
 from xlml.apis import gcp_config, metric_config, task, test_config
 from dags import test_owner
 from dags.multipod.configs import common
-from dags.vm_resource import TpuVersion, Project, RuntimeVersion
+from dags.vm_resource import TpuVersion, Zone, Project, V5_NETWORKS, V5E_SUBNETWORKS, V5P_SUBNETWORKS, RuntimeVersion
 
 PROJECT_NAME = Project.CLOUD_ML_AUTO_SOLUTIONS.value
 RUNTIME_IMAGE = RuntimeVersion.TPU_UBUNTU2204_BASE.value
 GCS_SUBFOLDER_PREFIX = test_owner.Team.INFERENCE.value
 
+# Sweep settings copied unchanged into each benchmark's model configs
+SWEEP_CONFIG_KEYS = (
+    "model_mode",
+    "sleep_time",
+    "checkpoint",
+    "maxtext_logs",
+    "scan_layers",
+    "dataset",
+    "weight_dtype",
+    "tokenizer",
+    "request_rate",
+    "num_prompts",
+    "max_target_length",
+    "max_prefill_predict_length",
+    "max_output_length",
+)
+
+# (project_name, zone, network, subnetwork, runtime_version) per TPU version
+TPU_ENV = {
+    TpuVersion.V5E: (
+        Project.TPU_PROD_ENV_AUTOMATED.value,
+        Zone.US_EAST1_C.value,
+        V5_NETWORKS,
+        V5E_SUBNETWORKS,
+        RuntimeVersion.V2_ALPHA_TPUV5_LITE.value,
+    ),
+    TpuVersion.V5P: (
+        Project.TPU_PROD_ENV_AUTOMATED.value,
+        Zone.US_EAST5_A.value,
+        V5_NETWORKS,
+        V5P_SUBNETWORKS,
+        RuntimeVersion.V2_ALPHA_TPUV5.value,
+    ),
+}
+
+# Keys that get_maxtext_inference_nightly_config reads from model_configs
+MODEL_CONFIG_KEYS = frozenset((
+    "model_name",
+    "model_mode",
+    "sleep_time",
+    "checkpoint",
+    "scan_layers",
+    "dataset",
+    "weight_dtype",
+    "tokenizer",
+    "per_device_batch_size",
+    "ici_fsdp_parallelism",
+    "ici_autoregressive_parallelism",
+    "ici_tensor_parallelism",
+    "request_rate",
+    "num_prompts",
+    "max_target_length",
+    "max_prefill_predict_length",
+    "max_output_length",
+))
+
+
+def get_sweep_model_configs(
+    model: str,
+    sweep_model_configs: Dict,
+    per_device_batch_size: int,
+    ici_parallelism: Tuple[int, int, int],
+) -> Dict:
+  """Builds the model configs for a single point of an inference sweep."""
+  ici_fsdp, ici_ar, ici_tensor = ici_parallelism
+  model_configs = {key: sweep_model_configs[key] for key in SWEEP_CONFIG_KEYS}
+  # Set per_device_batch_size to a single value, not a list
+  model_configs.update(
+      model_name=model,
+      per_device_batch_size=per_device_batch_size,
+      ici_fsdp_parallelism=ici_fsdp,
+      ici_autoregressive_parallelism=ici_ar,
+      ici_tensor_parallelism=ici_tensor,
+  )
+  return model_configs
+
 
 def get_maxtext_inference_nightly_config(
     tpu_version: TpuVersion,
@@ -34,14 +110,20 @@ def get_maxtext_inference_nightly_config(
     time_out_in_min: int,
     test_name: str,
     test_mode: common.SetupMode,
+    model_configs: Dict,
     project_name: str = PROJECT_NAME,
     runtime_version: str = RUNTIME_IMAGE,
     network: str = "default",
     subnetwork: str = "default",
     is_tpu_reserved: bool = True,
     num_slices: int = 1,
-    model_configs: Dict = {},
 ):
+  missing_keys = MODEL_CONFIG_KEYS.difference(model_configs)
+  if missing_keys:
+    raise ValueError(
+        f"model_configs for {test_name} is missing {sorted(missing_keys)}."
+    )
+
   job_gcp_config = gcp_config.GCPConfig(
       project_name=project_name,
       zone=tpu_zone,
@@ -15,10 +15,11 @@
 """A DAG to run MaxText inference benchmarks with nightly version."""
 
 import datetime
+import itertools
 from airflow import models
 from airflow.models.baseoperator import chain
 from dags import composer_env, test_owner
-from dags.vm_resource import TpuVersion, Zone, Project, V5_NETWORKS, V5E_SUBNETWORKS, V5P_SUBNETWORKS, RuntimeVersion
+from dags.vm_resource import TpuVersion
 from dags.inference.configs import maxtext_inference_gce_config
 from dags.multipod.configs.common import SetupMode, Platform
 
@@ -26,6 +27,86 @@ from dags.multipod.configs.common import SetupMode, Platform
 # Run once a day at 4 am UTC (8 pm PST)
 SCHEDULED_TIME = "0 4 * * *" if composer_env.is_prod_env() else None
 
+TEST_NAME_PREFIX = "maxtext-inference"
+TEST_MODELS = {
+    "llama2-7b": {
+        "sleep_time": 120,
+        "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
+        "checkpoint": "gs://inference-benchmarks/models/llama2-7b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
+        "model_mode": "base",
+        "maxtext_logs": "gs://inference-benchmarks/models/llama2-7b/2024-04-25-14-01/",
+        "scan_layers": "false",
+        "dataset": "openorca",
+        "weight_dtype": "bfloat16",
+        "tokenizer": "tokenizer.llama2",
+        "per_device_batch_sizes": [1, 2, 4, 8, 11, 12],
+        # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
+        "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
+        "request_rate": 5,
+        "num_prompts": 1000,
+        "max_prefill_predict_length": 1024,
+        "max_target_length": 2048,
+        "max_output_length": 1024,
+    },
+    "llama2-13b": {
+        "sleep_time": 120,
+        "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
+        "checkpoint": "gs://inference-benchmarks/models/llama2-13b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
+        "model_mode": "base",
+        "maxtext_logs": "gs://inference-benchmarks/models/llama2-13b/2024-04-25-14-01/",
+        "scan_layers": "false",
+        "dataset": "openorca",
+        "weight_dtype": "bfloat16",
+        "tokenizer": "tokenizer.llama2",
+        "per_device_batch_sizes": [1, 2, 4, 5, 6],
+        # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
+        "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
+        "request_rate": 5,
+        "num_prompts": 1000,
+        "max_prefill_predict_length": 1024,
+        "max_target_length": 2048,
+        "max_output_length": 1024,
+    },
+    "llama2-70b": {
+        "sleep_time": 240,
+        "tpu_version_cores": [(TpuVersion.V5P, 8)],
+        "per_device_batch_sizes": [12, 16, 20, 24],
+        "checkpoint": "gs://inference-benchmarks/models/llama2-70b-chat/2024-05-08-23-16/param-only-decode-ckpt-maxtext/checkpoints/0/items",
+        "model_mode": "chat",
+        "maxtext_logs": "gs://inference-benchmarks/models/llama2-70b-chat/2024-05-08-23-16/",
+        "scan_layers": "false",
+        "dataset": "openorca",
+        "weight_dtype": "bfloat16",
+        "tokenizer": "tokenizer.llama2",
+        # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
+        "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
+        "request_rate": 5,
+        "num_prompts": 1000,
+        "max_prefill_predict_length": 1024,
+        "max_target_length": 2048,
+        "max_output_length": 1024,
+    },
+    "gemma-7b": {
+        "sleep_time": 120,
+        "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
+        "checkpoint": "gs://inference-benchmarks/models/gemma-7b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
+        "model_mode": "base",
+        "maxtext_logs": "gs://inference-benchmarks/models/gemma-7b/2024-04-25-14-01/",
+        "scan_layers": "false",
+        "dataset": "openorca",
+        "weight_dtype": "bfloat16",
+        "tokenizer": "tokenizer.gemma",
+        "per_device_batch_sizes": [1, 2, 4, 8, 11, 12],
+        # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
+        "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
+        "request_rate": 5,
+        "num_prompts": 1000,
+        "max_prefill_predict_length": 1024,
+        "max_target_length": 2048,
+        "max_output_length": 1024,
+    },
+}
+
 
 with models.DAG(
     dag_id="maxtext_inference",
@@ -33,162 +114,52 @@ with models.DAG(
     tags=["inference_team", "maxtext", "nightly", "benchmark"],
     start_date=datetime.datetime(2024, 1, 19),
     catchup=False,
+    default_args=composer_env.RETRY_DEFAULT_ARGS,
 ) as dag:
-  test_name_prefix = "maxtext-inference"
-  test_models = {
-      "llama2-7b": {
-          "sleep_time": 120,
-          "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
-          "checkpoint": "gs://inference-benchmarks/models/llama2-7b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
-          "model_mode": "base",
-          "maxtext_logs": "gs://inference-benchmarks/models/llama2-7b/2024-04-25-14-01/",
-          "scan_layers": "false",
-          "dataset": "openorca",
-          "weight_dtype": "bfloat16",
-          "tokenizer": "tokenizer.llama2",
-          "per_device_batch_sizes": [1, 2, 4, 8, 11, 12],
-          # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
-          "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
-          "request_rate": 5,
-          "num_prompts": 1000,
-          "max_prefill_predict_length": 1024,
-          "max_target_length": 2048,
-          "max_output_length": 1024,
-      },
-      "llama2-13b": {
-          "sleep_time": 120,
-          "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
-          "checkpoint": "gs://inference-benchmarks/models/llama2-13b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
-          "model_mode": "base",
-          "maxtext_logs": "gs://inference-benchmarks/models/llama2-13b/2024-04-25-14-01/",
-          "scan_layers": "false",
-          "dataset": "openorca",
-          "weight_dtype": "bfloat16",
-          "tokenizer": "tokenizer.llama2",
-          "per_device_batch_sizes": [1, 2, 4, 5, 6],
-          # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
-          "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
-          "request_rate": 5,
-          "num_prompts": 1000,
-          "max_prefill_predict_length": 1024,
-          "max_target_length": 2048,
-          "max_output_length": 1024,
-      },
-      "llama2-70b": {
-          "sleep_time": 240,
-          "tpu_version_cores": [(TpuVersion.V5P, 8)],
-          "per_device_batch_sizes": [12, 16, 20, 24],
-          "checkpoint": "gs://inference-benchmarks/models/llama2-70b-chat/2024-05-08-23-16/param-only-decode-ckpt-maxtext/checkpoints/0/items",
-          "model_mode": "chat",
-          "maxtext_logs": "gs://inference-benchmarks/models/llama2-70b-chat/2024-05-08-23-16/",
-          "scan_layers": "false",
-          "dataset": "openorca",
-          "weight_dtype": "bfloat16",
-          "tokenizer": "tokenizer.llama2",
-          # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
-          "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
-          "request_rate": 5,
-          "num_prompts": 1000,
-          "max_prefill_predict_length": 1024,
-          "max_target_length": 2048,
-          "max_output_length": 1024,
-      },
-      "gemma-7b": {
-          "sleep_time": 120,
-          "tpu_version_cores": [(TpuVersion.V5E, 8), (TpuVersion.V5P, 8)],
-          "checkpoint": "gs://inference-benchmarks/models/gemma-7b/2024-04-25-14-01/param-only-decode-ckpt-maxtext/checkpoints/0/items",
-          "model_mode": "base",
-          "maxtext_logs": "gs://inference-benchmarks/models/gemma-7b/2024-04-25-14-01/",
-          "scan_layers": "false",
-          "dataset": "openorca",
-          "weight_dtype": "bfloat16",
-          "tokenizer": "tokenizer.gemma",
-          "per_device_batch_sizes": [1, 2, 4, 8, 11, 12],
-          # (ici_fsdp_parallelism, ici_autoregressive_parallelism, ici_tensor_parallelism)
-          "ici_parallelisms": [(1, -1, 1), (1, 1, -1)],
-          "request_rate": 5,
-          "num_prompts": 1000,
-          "max_prefill_predict_length": 1024,
-          "max_target_length": 2048,
-          "max_output_length": 1024,
-      },
-  }
-
-  for model, sweep_model_configs in test_models.items():
-    # tasks_per_model = []
-    for per_device_batch_size in sweep_model_configs["per_device_batch_sizes"]:
-      for ici_parallelism in sweep_model_configs["ici_parallelisms"]:
-        for tpu_version, tpu_cores in sweep_model_configs["tpu_version_cores"]:
-          # Set per_device_batch_size to a single value, not a list
-          model_configs = {}
-          model_configs["model_name"] = model
-          model_configs["model_mode"] = sweep_model_configs["model_mode"]
-          model_configs["sleep_time"] = sweep_model_configs["sleep_time"]
-          model_configs["checkpoint"] = sweep_model_configs["checkpoint"]
-          model_configs["maxtext_logs"] = sweep_model_configs["maxtext_logs"]
-          model_configs["scan_layers"] = sweep_model_configs["scan_layers"]
-          model_configs["dataset"] = sweep_model_configs["dataset"]
-          model_configs["weight_dtype"] = sweep_model_configs["weight_dtype"]
-          model_configs["tokenizer"] = sweep_model_configs["tokenizer"]
-          model_configs["per_device_batch_size"] = per_device_batch_size
-          ici_fsdp = ici_parallelism[0]
-          ici_ar = ici_parallelism[1]
-          ici_tensor = ici_parallelism[2]
-          model_configs["ici_fsdp_parallelism"] = ici_fsdp
-          model_configs["ici_autoregressive_parallelism"] = ici_ar
-          model_configs["ici_tensor_parallelism"] = ici_tensor
-          model_configs["request_rate"] = sweep_model_configs["request_rate"]
-          model_configs["num_prompts"] = sweep_model_configs["num_prompts"]
-          model_configs["max_target_length"] = sweep_model_configs[
-              "max_target_length"
-          ]
-          model_configs["max_prefill_predict_length"] = sweep_model_configs[
-              "max_prefill_predict_length"
-          ]
-          model_configs["max_output_length"] = sweep_model_configs[
-              "max_output_length"
-          ]
+  for model, sweep_model_configs in TEST_MODELS.items():
+    for (
+        per_device_batch_size,
+        ici_parallelism,
+        (tpu_version, tpu_cores),
+    ) in itertools.product(
+        sweep_model_configs["per_device_batch_sizes"],
+        sweep_model_configs["ici_parallelisms"],
+        sweep_model_configs["tpu_version_cores"],
+    ):
+      ici_fsdp, ici_ar, ici_tensor = ici_parallelism
+      model_configs = maxtext_inference_gce_config.get_sweep_model_configs(
+          model, sweep_model_configs, per_device_batch_size, ici_parallelism
+      )
 
-          if tpu_version == TpuVersion.V5E:
-            # v5e benchmarks
-            project_name = Project.TPU_PROD_ENV_AUTOMATED.value
-            zone = Zone.US_EAST1_C.value
-            network = V5_NETWORKS
-            subnetwork = V5E_SUBNETWORKS
-            runtime_version = RuntimeVersion.V2_ALPHA_TPUV5_LITE.value
-          elif tpu_version == TpuVersion.V5P:
-            zone = Zone.US_EAST5_A.value
-            runtime_version = RuntimeVersion.V2_ALPHA_TPUV5.value
-            project_name = Project.TPU_PROD_ENV_AUTOMATED.value
-            network = V5_NETWORKS
-            subnetwork = V5P_SUBNETWORKS
+      tpu_env = maxtext_inference_gce_config.TPU_ENV[tpu_version]
+      project_name, zone, network, subnetwork, runtime_version = tpu_env
 
-          maxtext_stable_1slice = maxtext_inference_gce_config.get_maxtext_inference_nightly_config(
-              tpu_version=tpu_version,
-              tpu_cores=tpu_cores,
-              tpu_zone=zone,
-              runtime_version=runtime_version,
-              project_name=project_name,
-              time_out_in_min=60,
-              is_tpu_reserved=True,
-              test_name=f"{test_name_prefix}-stable-{model}-per_device_batch_size-{per_device_batch_size}-ici-fsdp{ici_fsdp}-ar{ici_ar}-tensor{ici_tensor}",
-              test_mode=SetupMode.STABLE,
-              network=network,
-              subnetwork=subnetwork,
-              model_configs=model_configs,
-          )
-          maxtext_nightly_1slice = maxtext_inference_gce_config.get_maxtext_inference_nightly_config(
-              tpu_version=tpu_version,
-              tpu_cores=tpu_cores,
-              tpu_zone=zone,
-              runtime_version=runtime_version,
-              project_name=project_name,
-              time_out_in_min=60,
-              is_tpu_reserved=True,
-              test_name=f"{test_name_prefix}-nightly-{model}-per_device_batch_size-{per_device_batch_size}-ici-fsdp{ici_fsdp}-ar{ici_ar}-tensor{ici_tensor}",
-              test_mode=SetupMode.NIGHTLY,
-              network=network,
-              subnetwork=subnetwork,
-              model_configs=model_configs,
-          )
-          maxtext_stable_1slice >> maxtext_nightly_1slice
+      maxtext_stable_1slice = maxtext_inference_gce_config.get_maxtext_inference_nightly_config(
+          tpu_version=tpu_version,
+          tpu_cores=tpu_cores,
+          tpu_zone=zone,
+          runtime_version=runtime_version,
+          project_name=project_name,
+          time_out_in_min=60,
+          is_tpu_reserved=True,
+          test_name=f"{TEST_NAME_PREFIX}-stable-{model}-per_device_batch_size-{per_device_batch_size}-ici-fsdp{ici_fsdp}-ar{ici_ar}-tensor{ici_tensor}",
+          test_mode=SetupMode.STABLE,
+          network=network,
+          subnetwork=subnetwork,
+          model_configs=model_configs,
+      )
+      maxtext_nightly_1slice = maxtext_inference_gce_config.get_maxtext_inference_nightly_config(
+          tpu_version=tpu_version,
+          tpu_cores=tpu_cores,
+          tpu_zone=zone,
+          runtime_version=runtime_version,
+          project_name=project_name,
+          time_out_in_min=60,
+          is_tpu_reserved=True,
+          test_name=f"{TEST_NAME_PREFIX}-nightly-{model}-per_device_batch_size-{per_device_batch_size}-ici-fsdp{ici_fsdp}-ar{ici_ar}-tensor{ici_tensor}",
+          test_mode=SetupMode.NIGHTLY,
+          network=network,
+          subnetwork=subnetwork,
+          model_configs=model_configs,
+      )
+      maxtext_stable_1slice >> maxtext_nightly_1slice
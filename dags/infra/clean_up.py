@@ -34,15 +34,15 @@ with models.DAG(
 ) as dag:
   # List tpu zones for projects to avoid permission issue
   tpu_zones = [
-      Zone.US_CENTRAL1_A,
-      Zone.US_CENTRAL1_B,
-      Zone.US_CENTRAL2_B,
-      Zone.US_CENTRAL1_C,
-      Zone.US_EAST1_D,
+      Zone.US_CENTRAL1_A.value,
+      Zone.US_CENTRAL1_B.value,
+      Zone.US_CENTRAL2_B.value,
+      Zone.US_CENTRAL1_C.value,
+      Zone.US_EAST1_D.value,
   ]
   v5_tpu_zones = [
-      Zone.US_EAST1_C,
-      Zone.US_EAST5_A,
+      Zone.US_EAST1_C.value,
+      Zone.US_EAST5_A.value,
   ]
 
   # TPUs
@@ -199,6 +199,7 @@ with models.DAG(
     tags=["pytorchxla", "latest", "supported", "xlml"],
     start_date=datetime.datetime(2023, 7, 12),
     catchup=False,
+    default_args=composer_env.RETRY_DEFAULT_ARGS,
 ):
   torchvision()
   huggingface()
@@ -16,15 +16,26 @@
 
 import datetime
 import enum
+import sys
 
 
-V5_NETWORKS_PREFIX = "projects/tpu-prod-env-automated"
-V5_NETWORKS = f"{V5_NETWORKS_PREFIX}/global/networks/mas-test"
-V5E_SUBNETWORKS = f"{V5_NETWORKS_PREFIX}/regions/us-east1/subnetworks/mas-test"
-V5P_SUBNETWORKS = f"{V5_NETWORKS_PREFIX}/regions/us-east5/subnetworks/mas-test"
-
+# Evaluated once so that every dated image tag agrees within a DAG parse
+_TODAY = datetime.date.today().isoformat()
+_TODAY_COMPACT = _TODAY.replace("-", "")
 
-class Project(enum.Enum):
+V5_NETWORKS_PREFIX = "projects/tpu-prod-env-automated"
+# Interned as these paths are stored on, and compared across, many TPU configs
+V5_NETWORKS = sys.intern(f"{V5_NETWORKS_PREFIX}/global/networks/mas-test")
+V5E_SUBNETWORKS = sys.intern(
+    f"{V5_NETWORKS_PREFIX}/regions/us-east1/subnetworks/mas-test"
+)
+V5P_SUBNETWORKS = sys.intern(
+    f"{V5_NETWORKS_PREFIX}/regions/us-east5/subnetworks/mas-test"
+)
+
+
+@enum.unique
+class Project(enum.StrEnum):
   """Common GCP projects."""
 
   CLOUD_ML_AUTO_SOLUTIONS = "cloud-ml-auto-solutions"
@@ -35,26 +46,30 @@ class Project(enum.Enum):
   CLOUD_TPU_INFERENCE_TEST = "cloud-tpu-inference-test"
 
 
-class ImageProject(enum.Enum):
+@enum.unique
+class ImageProject(enum.StrEnum):
   """Common image projects for GPU."""
 
   DEEP_LEARNING_PLATFORM_RELEASE = "deeplearning-platform-release"
 
 
-class ImageFamily(enum.Enum):
+@enum.unique
+class ImageFamily(enum.StrEnum):
   """Common image families for GPU."""
 
   COMMON_CU121_DEBIAN_11 = "common-cu121-debian-11"
 
 
-class Region(enum.Enum):
+@enum.unique
+class Region(enum.StrEnum):
   """Common GCP regions."""
 
   # used for GKE
   US_CENTRAL1 = "us-central1"
 
 
-class Zone(enum.Enum):
+@enum.unique
+class Zone(enum.StrEnum):
   """Common GCP zones."""
 
   # reserved/on-demand v2-32 in cloud-ml-auto-solutions
@@ -80,7 +95,8 @@ class Zone(enum.Enum):
   US_WEST1_C = "us-west1-c"
 
 
-class MachineVersion(enum.Enum):
+@enum.unique
+class MachineVersion(enum.StrEnum):
   """Common machine types."""
 
   N1_STANDARD_8 = "n1-standard-8"
@@ -91,7 +107,8 @@ class MachineVersion(enum.Enum):
   G2_STAND_4 = "g2-standard-4"
 
 
-class TpuVersion(enum.Enum):
+@enum.unique
+class TpuVersion(enum.StrEnum):
   """Common TPU versions."""
 
   V2 = "2"
@@ -101,7 +118,8 @@ class TpuVersion(enum.Enum):
   V5P = "5p"
 
 
-class GpuVersion(enum.Enum):
+@enum.unique
+class GpuVersion(enum.StrEnum):
   """Common GPU versions."""
 
   L4 = "nvidia-l4"
@@ -111,14 +129,16 @@ class GpuVersion(enum.Enum):
   V100 = "nvidia-tesla-v100"
 
 
-class CpuVersion(enum.Enum):
+@enum.unique
+class CpuVersion(enum.StrEnum):
   """Common CPU versions."""
 
   M1_MEGAMEM = "m1-megamem-96"
   N2_STANDARD = "n2-standard-64"
 
 
-class RuntimeVersion(enum.Enum):
+@enum.unique
+class RuntimeVersion(enum.StrEnum):
   """Common runtime versions."""
 
   TPU_VM_TF_NIGHTLY = "tpu-vm-tf-nightly"
@@ -134,7 +154,8 @@ class RuntimeVersion(enum.Enum):
   V2_ALPHA_TPUV5 = "v2-alpha-tpuv5"
 
 
-class ClusterName(enum.Enum):
+@enum.unique
+class ClusterName(enum.StrEnum):
   """Common XPK cluster names."""
 
   V4_8_CLUSTER = "mas-v4-8"
@@ -153,38 +174,45 @@ class ClusterName(enum.Enum):
   CPU_N2_STANDARD_64 = "shared-n2-standard-64"
 
 
-class DockerImage(enum.Enum):
-  """Common docker images."""
-
-  XPK_JAX_TEST = "gcr.io/cloud-ml-auto-solutions/xpk_jax_test:latest"
-  PYTORCH_NIGHTLY = (
-      "us-central1-docker.pkg.dev/tpu-pytorch-releases/docker/"
-      f"xla:nightly_3.10_tpuvm_{datetime.datetime.today().strftime('%Y%m%d')}"
-  )
-  MAXTEXT_TPU_JAX_STABLE = (
-      "gcr.io/tpu-prod-env-multipod/maxtext_jax_stable:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
-  MAXTEXT_TPU_JAX_SS = (
-      "gcr.io/tpu-prod-env-multipod/jax-ss-maxtext-unpinned:06032024"
-  )
-  MAXTEXT_TPU_JAX_NIGHTLY = (
-      "gcr.io/tpu-prod-env-multipod/maxtext_jax_nightly:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
-  MAXTEXT_GPU_JAX_PINNED = (
-      "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_pinned:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
-  MAXTEXT_GPU_JAX_STABLE = (
-      "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_stable:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
-  MAXTEXT_GPU_JAX_NIGHTLY = (
-      "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_nightly:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
-  CLOUD_HYBRIDSIM_NIGHTLY = (
-      "us-docker.pkg.dev/cloud-tpu-v2-images-dev/hybridsim/cloud_hybridsim_gcloud_python:"
-      f"{datetime.datetime.today().strftime('%Y-%m-%d')}"
-  )
+# Docker image URIs; {date} and {date_compact} are filled with today's date
+_DOCKER_IMAGE_TEMPLATES = {
+    "XPK_JAX_TEST": "gcr.io/cloud-ml-auto-solutions/xpk_jax_test:latest",
+    "PYTORCH_NIGHTLY": (
+        "us-central1-docker.pkg.dev/tpu-pytorch-releases/docker/"
+        "xla:nightly_3.10_tpuvm_{date_compact}"
+    ),
+    "MAXTEXT_TPU_JAX_STABLE": (
+        "gcr.io/tpu-prod-env-multipod/maxtext_jax_stable:{date}"
+    ),
+    "MAXTEXT_TPU_JAX_SS": (
+        "gcr.io/tpu-prod-env-multipod/jax-ss-maxtext-unpinned:06032024"
+    ),
+    "MAXTEXT_TPU_JAX_NIGHTLY": (
+        "gcr.io/tpu-prod-env-multipod/maxtext_jax_nightly:{date}"
+    ),
+    "MAXTEXT_GPU_JAX_PINNED": (
+        "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_pinned:{date}"
+    ),
+    "MAXTEXT_GPU_JAX_STABLE": (
+        "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_stable:{date}"
+    ),
+    "MAXTEXT_GPU_JAX_NIGHTLY": (
+        "gcr.io/tpu-prod-env-multipod/maxtext_gpu_jax_nightly:{date}"
+    ),
+    "CLOUD_HYBRIDSIM_NIGHTLY": (
+        "us-docker.pkg.dev/cloud-tpu-v2-images-dev/hybridsim/cloud_hybridsim_gcloud_python:"
+        "{date}"
+    ),
+}
+
+DockerImage = enum.unique(
+    enum.StrEnum(
+        "DockerImage",
+        {
+            name: template.format(date=_TODAY, date_compact=_TODAY_COMPACT)
+            for name, template in _DOCKER_IMAGE_TEMPLATES.items()
+        },
+        module=__name__,
+    )
+)
+DockerImage.__doc__ = "Common docker images."
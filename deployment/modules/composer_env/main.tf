@@ -19,6 +19,7 @@ resource "google_composer_environment" "example_environment" {
         fabric                            = ""
         google-cloud-tpu                  = ">=1.16.0"
         jsonlines                         = ""
+        orjson                            = ""
         # These packages are already in the default composer environment.
         # See https://cloud.google.com/composer/docs/concepts/versioning/composer-versions
         # google-cloud-bigquery             = ""
@@ -20,6 +20,7 @@ import datetime
 import shlex
 from typing import Optional, Tuple, Union
 import airflow
+import attrs
 from airflow.models.taskmixin import DAGNode
 from airflow.utils.task_group import TaskGroup
 from xlml.apis import gcp_config, metric_config, test_config
@@ -194,7 +195,10 @@ class XpkTask(BaseTask):
       new_run_model_cmds = [f"export M_RUN_NAME={run_name}"]
       for cmd in self.task_test_config.run_model_cmds:
         new_run_model_cmds.append(cmd)
-      self.task_test_config.run_model_cmds = new_run_model_cmds
+      # Rebuild the config so its cached scripts include the new command
+      self.task_test_config = attrs.evolve(
+          self.task_test_config, run_model_cmds=new_run_model_cmds
+      )
 
       # Update tensorboard file location
       self.task_metric_config.tensorboard_summary.file_location = (
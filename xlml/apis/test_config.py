@@ -20,7 +20,7 @@ Why not use data classes? Before Python 3.10, init parameters for inherited
 data classes are put in the order in which they are defined. Take this example:
 
 ```
-class TestConfig(abc.ABC, Generic[A]):
+class TestConfig(Generic[A]):
   accelerator: A
   task_owner: Optional[str] = None
 
@@ -43,28 +43,40 @@ functionality from `attrs` for now.
 When Composer updates to a recent Python version, we can use dataclasses.
 """
 
-import abc
-import json
+import functools
 import os
+import pathlib
 import shlex
-from typing import Any, Generic, Iterable, List, Optional, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import attrs
 import datetime
+import orjson
 from dags.vm_resource import TpuVersion, CpuVersion
 
 
-class Accelerator(abc.ABC):
+class Accelerator:
   """Represents an ML accelerator."""
 
+  # Keep slotted attrs subclasses free of a per-instance __dict__
+  __slots__ = ()
+
   @property
-  @abc.abstractmethod
   def name(self) -> str:
     """Name of this ML accelerator."""
     raise NotImplementedError
 
 
-@attrs.define
+@attrs.frozen
 class Tpu(Accelerator):
   """Represents a single Cloud TPU instance.
 
@@ -84,14 +96,18 @@ class Tpu(Accelerator):
   network: str = 'default'
   subnetwork: str = 'default'
   reserved: bool = False
+  _name: str = attrs.field(init=False, repr=False, eq=False)
+
+  def __attrs_post_init__(self):
+    object.__setattr__(self, '_name', f'v{self.version.value}-{self.cores}')
 
   @property
   def name(self):
     """Name of this TPU type in the Cloud TPU API (e.g. 'v4-8')."""
-    return f'v{self.version.value}-{self.cores}'
+    return self._name
 
 
-@attrs.define
+@attrs.frozen
 class Gpu(Accelerator):
   """Represents a single Cloud GPU instance.
 
@@ -115,7 +131,7 @@ class Gpu(Accelerator):
     return self.accelerator_type
 
 
-@attrs.define
+@attrs.frozen
 class Cpu(Accelerator):
   """Represents a single Cloud CPU instance.
 
@@ -125,18 +141,41 @@ class Cpu(Accelerator):
 
   device_type: CpuVersion
   machine_count: int
+  _name: str = attrs.field(init=False, repr=False, eq=False)
+
+  def __attrs_post_init__(self):
+    object.__setattr__(
+        self, '_name', f'{self.device_type.value}-{self.machine_count}'
+    )
 
   @property
   def name(self):
     """Name of this CPU type (e.g. 'n2-standard-64-1')."""
-    return f'{self.device_type.value}-{self.machine_count}'
+    return self._name
 
 
 A = TypeVar('A', bound=Accelerator)
 
+# Shell options that prefix every generated setup and test script
+_SET_XUE = 'set -xue'
+
+
+def _to_cmd_tuple(cmds: Optional[Iterable[str]]) -> Tuple[str, ...]:
+  """Materializes shell commands so they can be joined more than once."""
+  return tuple(cmds) if cmds is not None else ()
+
+
+def _slice_benchmark_id(
+    test_name: str, accelerator: Accelerator, num_slices: int
+) -> str:
+  """Benchmark ID for a test that may span several accelerator slices."""
+  if num_slices == 1:
+    return f'{test_name}-{accelerator.name}'
+  return f'{test_name}-{num_slices}x{accelerator.name}'
 
-@attrs.define
-class TestConfig(abc.ABC, Generic[A]):
+
+@attrs.frozen
+class TestConfig(Generic[A]):
   """Base class for end-to-end test configurations.
 
   Attributes:
@@ -154,7 +193,6 @@ class TestConfig(abc.ABC, Generic[A]):
   gcs_subfolder: str = attrs.field(default='unowned', kw_only=True)
 
   @property
-  @abc.abstractmethod
   def benchmark_id(self) -> str:
     """Unique key for metrics generated by this test."""
     raise NotImplementedError()
@@ -165,7 +203,6 @@ class TestConfig(abc.ABC, Generic[A]):
     return None
 
   @property
-  @abc.abstractmethod
   def test_script(self) -> str:
     """Script to run on accelerator machine.
 
@@ -174,7 +211,7 @@ class TestConfig(abc.ABC, Generic[A]):
     raise NotImplementedError()
 
 
-@attrs.define
+@attrs.frozen
 class TpuVmTest(TestConfig[Tpu]):
   """Test config that runs on a single Cloud TPU VM instance.
 
@@ -185,29 +222,41 @@ class TpuVmTest(TestConfig[Tpu]):
     num_slices: Number of TPU slices.
   """
 
+  _CMD_SEP: ClassVar[str] = '\n'
+
   test_name: str
-  set_up_cmds: Iterable[str]
-  run_model_cmds: Iterable[str]
+  set_up_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  run_model_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
   num_slices: int = attrs.field(default=1, kw_only=True)
+  _benchmark_id: str = attrs.field(init=False, repr=False, eq=False)
+  _setup_script: str = attrs.field(init=False, repr=False, eq=False)
+  _test_script: str = attrs.field(init=False, repr=False, eq=False)
+
+  def __attrs_post_init__(self):
+    benchmark_id = _slice_benchmark_id(
+        self.test_name, self.accelerator, self.num_slices
+    )
+    # Frozen attrs classes can only set fields through object.__setattr__
+    object.__setattr__(self, '_benchmark_id', benchmark_id)
+    setup_script = self._CMD_SEP.join((_SET_XUE, *self.set_up_cmds))
+    test_script = self._CMD_SEP.join((_SET_XUE, *self.run_model_cmds))
+    object.__setattr__(self, '_setup_script', setup_script)
+    object.__setattr__(self, '_test_script', test_script)
 
   @property
   def benchmark_id(self) -> str:
-    return (
-        f'{self.test_name}-{self.accelerator.name}'
-        if self.num_slices == 1
-        else f'{self.test_name}-{self.num_slices}x{self.accelerator.name}'
-    )
+    return self._benchmark_id
 
   @property
   def setup_script(self) -> Optional[str]:
-    return '\n'.join(('set -xue', *self.set_up_cmds))
+    return self._setup_script
 
   @property
   def test_script(self) -> str:
-    return '\n'.join(('set -xue', *self.run_model_cmds))
+    return self._test_script
 
 
-@attrs.define
+@attrs.frozen
 class GpuVmTest(TestConfig[Gpu]):
   """Test config that runs on a single Cloud GPU VM instance.
 
@@ -217,24 +266,38 @@ class GpuVmTest(TestConfig[Gpu]):
     run_model_cmds: List of commands to run the model under test.
   """
 
+  _CMD_SEP: ClassVar[str] = '\n'
+
   test_name: str
-  set_up_cmds: Iterable[str]
-  run_model_cmds: Iterable[str]
+  set_up_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  run_model_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  _benchmark_id: str = attrs.field(init=False, repr=False, eq=False)
+  _setup_script: str = attrs.field(init=False, repr=False, eq=False)
+  _test_script: str = attrs.field(init=False, repr=False, eq=False)
+
+  def __attrs_post_init__(self):
+    object.__setattr__(
+        self, '_benchmark_id', f'{self.test_name}-{self.accelerator.name}'
+    )
+    setup_script = self._CMD_SEP.join((_SET_XUE, *self.set_up_cmds))
+    test_script = self._CMD_SEP.join((_SET_XUE, *self.run_model_cmds))
+    object.__setattr__(self, '_setup_script', setup_script)
+    object.__setattr__(self, '_test_script', test_script)
 
   @property
   def benchmark_id(self) -> str:
-    return f'{self.test_name}-{self.accelerator.name}'
+    return self._benchmark_id
 
   @property
   def setup_script(self) -> Optional[str]:
-    return '\n'.join(('set -xue', *self.set_up_cmds))
+    return self._setup_script
 
   @property
   def test_script(self) -> str:
-    return '\n'.join(('set -xue', *self.run_model_cmds))
+    return self._test_script
 
 
-@attrs.define
+@attrs.frozen
 class CpuGkeTest(TestConfig[Cpu]):
   """Test config that runs on a single Cloud CPU instance in GKE cluster.
 
@@ -248,11 +311,13 @@ class CpuGkeTest(TestConfig[Cpu]):
     num_slices: Number of CPU slices.
   """
 
+  _CMD_SEP: ClassVar[str] = ';'
+
   test_name: str
   cluster_name: str
   docker_image: str
-  set_up_cmds: Iterable[str]
-  run_model_cmds: Iterable[str]
+  set_up_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  run_model_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
   startup_time_out_in_sec: int = attrs.field(default=300, kw_only=True)
   num_slices: int = attrs.field(default=1, kw_only=True)
 
@@ -262,14 +327,14 @@ class CpuGkeTest(TestConfig[Cpu]):
 
   @property
   def setup_script(self) -> Optional[str]:
-    return ';'.join(('set -xue', *self.set_up_cmds))
+    return self._CMD_SEP.join((_SET_XUE, *self.set_up_cmds))
 
   @property
   def test_script(self) -> str:
-    return ';'.join(('set -xue', *self.run_model_cmds))
+    return self._CMD_SEP.join((_SET_XUE, *self.run_model_cmds))
 
 
-@attrs.define
+@attrs.frozen
 class TpuGkeTest(TestConfig[Tpu]):
   """Test config that runs on a single Cloud TPU instance in GKE cluster.
 
@@ -283,44 +348,53 @@ class TpuGkeTest(TestConfig[Tpu]):
     num_slices: Number of TPU slices.
   """
 
+  _CMD_SEP: ClassVar[str] = ';'
+
   test_name: str
   cluster_name: str
   docker_image: str
-  set_up_cmds: Iterable[str]
-  run_model_cmds: Iterable[str]
+  set_up_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  run_model_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
   startup_time_out_in_sec: int = attrs.field(default=300, kw_only=True)
   num_slices: int = attrs.field(default=1, kw_only=True)
+  _benchmark_id: str = attrs.field(init=False, repr=False, eq=False)
+  _setup_script: str = attrs.field(init=False, repr=False, eq=False)
+  _test_script: str = attrs.field(init=False, repr=False, eq=False)
+
+  def __attrs_post_init__(self):
+    benchmark_id = _slice_benchmark_id(
+        self.test_name, self.accelerator, self.num_slices
+    )
+    object.__setattr__(self, '_benchmark_id', benchmark_id)
+    setup_script = self._CMD_SEP.join((_SET_XUE, *self.set_up_cmds))
+    test_script = self._CMD_SEP.join((_SET_XUE, *self.run_model_cmds))
+    object.__setattr__(self, '_setup_script', setup_script)
+    object.__setattr__(self, '_test_script', test_script)
 
   @property
   def benchmark_id(self) -> str:
-    return (
-        f'{self.test_name}-{self.accelerator.name}'
-        if self.num_slices == 1
-        else f'{self.test_name}-{self.num_slices}x{self.accelerator.name}'
-    )
+    return self._benchmark_id
 
   @property
   def setup_script(self) -> Optional[str]:
-    return ';'.join(('set -xue', *self.set_up_cmds))
+    return self._setup_script
 
   @property
   def test_script(self) -> str:
-    return ';'.join(('set -xue', *self.run_model_cmds))
+    return self._test_script
+
+
+_CONFIG_DIR = pathlib.Path(
+    os.environ.get('XLMLTEST_CONFIGS', '/home/airflow/gcs/dags/dags/jsonnet')
+)
 
 
 def _load_compiled_jsonnet(test_name: str) -> Any:
   # TODO(wcromar): Parse GPU tests too
-  config_dir = os.environ.get(
-      'XLMLTEST_CONFIGS', '/home/airflow/gcs/dags/dags/jsonnet'
-  )
-  test_path = os.path.join(config_dir, test_name)
-  with open(test_path, 'r') as f:
-    test = json.load(f)
-
-  return test
+  return orjson.loads((_CONFIG_DIR / test_name).read_bytes())
 
 
-@attrs.define
+@attrs.frozen
 class GpuXpkTest(TestConfig[Gpu]):
   """Test config that runs on a single Cloud GPU instance in GKE cluster.
 
@@ -334,11 +408,13 @@ class GpuXpkTest(TestConfig[Gpu]):
     num_slices: Number of GPU slices.
   """
 
+  _CMD_SEP: ClassVar[str] = ';'
+
   test_name: str
   cluster_name: str
   docker_image: str
-  set_up_cmds: Iterable[str]
-  run_model_cmds: Iterable[str]
+  set_up_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
+  run_model_cmds: Tuple[str, ...] = attrs.field(converter=_to_cmd_tuple)
   startup_time_out_in_sec: int = attrs.field(default=300, kw_only=True)
   num_slices: int = attrs.field(default=1, kw_only=True)
 
@@ -348,14 +424,18 @@ class GpuXpkTest(TestConfig[Gpu]):
 
   @property
   def setup_script(self) -> Optional[str]:
-    return ';'.join(self.set_up_cmds)
+    return self._CMD_SEP.join(self.set_up_cmds)
 
   @property
   def test_script(self) -> str:
-    return ';'.join(self.run_model_cmds)
+    return self._CMD_SEP.join(self.run_model_cmds)
+
 
+# Returns one shared (immutable) Tpu per distinct accelerator spec
+_shared_tpu = functools.lru_cache(maxsize=None)(Tpu)
 
-@attrs.define
+
+@attrs.frozen
 class JSonnetTpuVmTest(TestConfig[Tpu]):
   """Convert legacy JSonnet test configs into a TestConfig.
 
@@ -373,8 +453,10 @@ class JSonnetTpuVmTest(TestConfig[Tpu]):
   test_name: str
   setup: str
   exports: str
-  test_command: List[str]
+  test_command: Tuple[str, ...] = attrs.field(converter=tuple)
   num_slices: int = 1
+  _setup_script: str = attrs.field(init=False, repr=False, eq=False)
+  _test_script: str = attrs.field(init=False, repr=False, eq=False)
 
   @staticmethod
   def _from_json_helper(
@@ -388,7 +470,7 @@ class JSonnetTpuVmTest(TestConfig[Tpu]):
   ):
     return JSonnetTpuVmTest(
         test_name=test['testName'],
-        accelerator=Tpu(
+        accelerator=_shared_tpu(
             version=TpuVersion(
                 str(test['accelerator']['version'])
                 + test['accelerator']['variant']
@@ -446,25 +528,28 @@ class JSonnetTpuVmTest(TestConfig[Tpu]):
         subnetwork=subnetwork,
     )
 
+  def __attrs_post_init__(self):
+    # TODO(wcromar): replace configmaps
+    test_script = '\n'.join(
+        (_SET_XUE, self.exports, shlex.join(self.test_command))
+    )
+    object.__setattr__(self, '_setup_script', f'{_SET_XUE}\n{self.setup}')
+    object.__setattr__(self, '_test_script', test_script)
+
   @property
   def benchmark_id(self) -> str:
     return self.test_name
 
   @property
   def setup_script(self) -> Optional[str]:
-    return '\n'.join(['set -xue', self.setup])
+    return self._setup_script
 
-  # TODO(wcromar): replace configmaps
   @property
   def test_script(self) -> str:
-    return '\n'.join([
-        'set -xue',
-        self.exports,
-        ' '.join(shlex.quote(s) for s in self.test_command),
-    ])
+    return self._test_script
 
 
-@attrs.define
+@attrs.frozen
 class GpuGkeTest(TestConfig[Gpu]):
   """
   Attributes:
@@ -477,8 +562,8 @@ class GpuGkeTest(TestConfig[Gpu]):
   """
 
   test_name: str
-  entrypoint_script: List[str]
-  test_command: List[str]
+  entrypoint_script: Tuple[str, ...] = attrs.field(converter=tuple)
+  test_command: Tuple[str, ...] = attrs.field(converter=tuple)
   docker_image: str
   num_hosts: int = 1
   gcs_subfolder: str = '/tmp/'
@@ -0,0 +1,236 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for test_config.py."""
+
+import json
+import pathlib
+import shlex
+import sys
+from unittest import mock
+from absl import flags
+from absl.testing import absltest
+from absl.testing import parameterized
+from xlml.apis import gcp_config, metric_config, task, test_config
+from xlml.utils import name_format
+from dags.vm_resource import TpuVersion
+
+
+_SET_UP_CMDS = ("pip install -U pip", "pip install jax")
+_RUN_MODEL_CMDS = ("cd /tmp", "python3 train.py --steps=10")
+
+
+class TestConfigTest(parameterized.TestCase, absltest.TestCase):
+
+  def get_tempdir(self):
+    try:
+      flags.FLAGS.test_tmpdir
+    except flags.UnparsedFlagAccessError:
+      flags.FLAGS(sys.argv)
+    return self.create_tempdir().full_path
+
+  @parameterized.named_parameters(
+      ("single_slice", 1, "my-test-v4-8"),
+      ("multi_slice", 2, "my-test-2xv4-8"),
+  )
+  def test_tpu_vm_test(self, num_slices, expected_benchmark_id):
+    config = test_config.TpuVmTest(
+        test_config.Tpu(version=TpuVersion.V4, cores=8),
+        test_name="my-test",
+        set_up_cmds=_SET_UP_CMDS,
+        run_model_cmds=_RUN_MODEL_CMDS,
+        num_slices=num_slices,
+    )
+
+    self.assertEqual(config.benchmark_id, expected_benchmark_id)
+    self.assertEqual(
+        config.setup_script, "\n".join(("set -xue", *_SET_UP_CMDS))
+    )
+    self.assertEqual(
+        config.test_script, "\n".join(("set -xue", *_RUN_MODEL_CMDS))
+    )
+
+  @parameterized.named_parameters(
+      ("single_slice", 1, "my-test-v4-8"),
+      ("multi_slice", 4, "my-test-4xv4-8"),
+  )
+  def test_tpu_gke_test(self, num_slices, expected_benchmark_id):
+    config = test_config.TpuGkeTest(
+        test_config.Tpu(version=TpuVersion.V4, cores=8),
+        test_name="my-test",
+        cluster_name="my-cluster",
+        docker_image="gcr.io/my-project/my-image",
+        set_up_cmds=_SET_UP_CMDS,
+        run_model_cmds=_RUN_MODEL_CMDS,
+        num_slices=num_slices,
+    )
+
+    self.assertEqual(config.benchmark_id, expected_benchmark_id)
+    self.assertEqual(config.setup_script, ";".join(("set -xue", *_SET_UP_CMDS)))
+    self.assertEqual(
+        config.test_script, ";".join(("set -xue", *_RUN_MODEL_CMDS))
+    )
+
+  @parameterized.named_parameters(
+      ("tpu_vm", test_config.TpuVmTest, {}, "\n"),
+      (
+          "tpu_gke",
+          test_config.TpuGkeTest,
+          {"cluster_name": "my-cluster", "docker_image": "my-image"},
+          ";",
+      ),
+  )
+  def test_generator_cmds_are_kept(self, config_cls, extra_kwargs, sep):
+    config = config_cls(
+        test_config.Tpu(version=TpuVersion.V4, cores=8),
+        test_name="my-test",
+        set_up_cmds=(cmd for cmd in _SET_UP_CMDS),
+        run_model_cmds=(cmd for cmd in _RUN_MODEL_CMDS),
+        **extra_kwargs,
+    )
+
+    self.assertEqual(config.set_up_cmds, _SET_UP_CMDS)
+    self.assertEqual(config.run_model_cmds, _RUN_MODEL_CMDS)
+    self.assertEqual(config.setup_script, sep.join(("set -xue", *_SET_UP_CMDS)))
+    self.assertEqual(
+        config.test_script, sep.join(("set -xue", *_RUN_MODEL_CMDS))
+    )
+
+  def test_jsonnet_tpu_vm_test_from_pytorch(self):
+    test_name = "pt-nightly-resnet50-func-v4-8-1vm"
+    compiled_test = {
+        "testName": test_name,
+        "accelerator": {"version": 4, "variant": "", "size": 8},
+        "tpuSettings": {
+            "softwareVersion": "tpu-ubuntu2204-base",
+            "tpuVmPytorchSetup": "pip install torch",
+            "tpuVmExtraSetup": "pip install torchvision",
+            "tpuVmExports": "export XLA_USE_BF16=1",
+        },
+        "command": [
+            "python3",
+            "train.py",
+            "--model=resnet50",
+            "--logdir=$HOME",
+        ],
+        "timeout": 3600,
+    }
+    config_dir = self.get_tempdir()
+    (pathlib.Path(config_dir) / test_name).write_text(json.dumps(compiled_test))
+
+    with mock.patch.object(
+        test_config, "_CONFIG_DIR", pathlib.Path(config_dir)
+    ):
+      config = test_config.JSonnetTpuVmTest.from_pytorch(test_name)
+
+    self.assertEqual(config.benchmark_id, test_name)
+    self.assertEqual(config.accelerator.name, "v4-8")
+    self.assertEqual(
+        config.setup_script,
+        "\n".join([
+            "set -xue",
+            "pip install torch\ncd ~\npip install torchvision",
+        ]),
+    )
+    self.assertEqual(
+        config.test_script,
+        "\n".join([
+            "set -xue",
+            "export XLA_USE_BF16=1",
+            " ".join(shlex.quote(s) for s in compiled_test["command"]),
+        ]),
+    )
+
+  def test_jsonnet_tpu_vm_test_multi_slice(self):
+    config = test_config.JSonnetTpuVmTest(
+        test_config.Tpu(version=TpuVersion.V4, cores=8),
+        test_name="my-test",
+        setup="pip install jax",
+        exports="export FOO=bar",
+        test_command=(arg for arg in ("bash", "-c", "python3 train.py")),
+        num_slices=2,
+    )
+
+    self.assertEqual(config.benchmark_id, "my-test")
+    self.assertEqual(
+        config.setup_script, "\n".join(["set -xue", "pip install jax"])
+    )
+    self.assertEqual(
+        config.test_script,
+        "\n".join([
+            "set -xue",
+            "export FOO=bar",
+            " ".join(
+                shlex.quote(s) for s in ("bash", "-c", "python3 train.py")
+            ),
+        ]),
+    )
+
+  def test_run_with_run_name_generation(self):
+    original_config = test_config.TpuGkeTest(
+        test_config.Tpu(version=TpuVersion.V4, cores=8),
+        test_name="my-test",
+        cluster_name="my-cluster",
+        docker_image="my-image",
+        set_up_cmds=_SET_UP_CMDS,
+        run_model_cmds=_RUN_MODEL_CMDS,
+    )
+    xpk_task = task.XpkTask(
+        task_test_config=original_config,
+        task_gcp_config=gcp_config.GCPConfig(
+            project_name="my-project",
+            zone="us-central2-b",
+            dataset_name=metric_config.DatasetOption.XLML_DATASET,
+        ),
+        task_metric_config=metric_config.MetricConfig(
+            tensorboard_summary=metric_config.SummaryConfig(
+                file_location="gs://my-bucket/tensorboard",
+                aggregation_strategy=metric_config.AggregationStrategy.LAST,
+            )
+        ),
+    )
+    run_name = mock.MagicMock()
+    run_name.__str__.return_value = "my-test-run"
+
+    with mock.patch.object(task, "TaskGroup"), mock.patch.object(
+        name_format, "generate_run_name", return_value=run_name
+    ), mock.patch.object(
+        name_format, "generate_tb_file_location"
+    ), mock.patch.object(
+        task.XpkTask, "run_model"
+    ), mock.patch.object(
+        task.XpkTask, "post_process"
+    ):
+      xpk_task.run_with_run_name_generation()
+
+    evolved_config = xpk_task.task_test_config
+    self.assertEqual(
+        evolved_config.run_model_cmds,
+        ("export M_RUN_NAME=my-test-run", *_RUN_MODEL_CMDS),
+    )
+    self.assertEqual(
+        evolved_config.test_script,
+        ";".join(
+            ("set -xue", "export M_RUN_NAME=my-test-run", *_RUN_MODEL_CMDS)
+        ),
+    )
+    self.assertEqual(evolved_config.benchmark_id, "my-test-v4-8")
+    self.assertEqual(original_config.run_model_cmds, _RUN_MODEL_CMDS)
+    self.assertEqual(
+        original_config.test_script, ";".join(("set -xue", *_RUN_MODEL_CMDS))
+    )
+
+
+if __name__ == "__main__":
+  absltest.main()
@@ -17,9 +17,7 @@
 import shlex
 
 
-def generate_startup_script(main_command: str) -> str:
-  escaped_command = shlex.quote(main_command)
-  return f"""
+_STARTUP_SCRIPT_TEMPLATE = """
 set -o pipefail
 bash -c {escaped_command} 2>&1 | tee /tmp/logs &
 pid=$!
@@ -30,6 +28,12 @@ echo $exit_status > /tmp/process_exit_status.txt
 """
 
 
+def generate_startup_script(main_command: str) -> str:
+  return _STARTUP_SCRIPT_TEMPLATE.format(
+      escaped_command=shlex.quote(main_command)
+  )
+
+
 def monitor_startup_script() -> str:
   return """
 # File paths
@@ -103,7 +103,7 @@ def create_queued_resource(
 
     if use_startup_script:
       main_command = '\n'.join(
-          task_test_config.set_up_cmds + task_test_config.run_model_cmds
+          (*task_test_config.set_up_cmds, *task_test_config.run_model_cmds)
       )
       startup_script_command = startup_script.generate_startup_script(
           main_command
@@ -415,8 +415,8 @@ def clean_up_idle_queued_resources(
 
   logging.info(f'Cleaning up resources in project {project_name}.')
   for zone in zones:
-    logging.info(f'Checking in zone {zone.value}.')
-    parent = f'projects/{project_name}/locations/{zone.value}'
+    logging.info(f'Checking in zone {zone}.')
+    parent = f'projects/{project_name}/locations/{zone}'
     request = tpu_api.types.ListQueuedResourcesRequest(parent=parent)
     responses = client.list_queued_resources(request)
 
@@ -443,8 +443,8 @@ def clean_up_idle_nodes(project_name: str, zones: Iterable[str]) -> None:
 
   logging.info(f'Cleaning up nodes in project {project_name}.')
   for zone in zones:
-    logging.info(f'Checking in zone {zone.value}.')
-    parent = f'projects/{project_name}/locations/{zone.value}'
+    logging.info(f'Checking in zone {zone}.')
+    parent = f'projects/{project_name}/locations/{zone}'
     request = tpu_api.types.ListNodesRequest(parent=parent)
     responses = client.list_nodes(request)
 